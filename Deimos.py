@@ -23,7 +23,7 @@ import statistics
 import re
 import pypresence
 from pypresence import AioPresence
-from src.command_parser import execute_flythrough, parse_command
+from src.command_parser import execute_flythrough, execute_command, tokenize_command
 from src.auto_pet import nomnom
 from src.drop_logger import logging_loop
 # from src.combat_new import Fighter
@@ -31,7 +31,7 @@ from src.stat_viewer import total_stats
 from src.teleport_math import navmap_tp, calc_Distance
 from src.questing import Quester
 from src.sigil import Sigil
-from src.utils import index_with_str, is_visible_by_path, is_free, auto_potions, auto_potions_force_buy, to_world, collect_wisps_with_limit, try_task_coro, read_webpage, override_wiz_install_using_handle#, assign_pet_level
+from src.utils import index_with_str, is_visible_by_path, is_free, auto_potions, auto_potions_force_buy, to_world, collect_wisps_with_limit, create_try_task, log_task_exception, read_webpage, override_wiz_install_using_handle#, assign_pet_level
 from src.paths import advance_dialog_path, decline_quest_path
 import PySimpleGUI as gui
 import pyperclip
@@ -477,6 +477,10 @@ async def kill_tool(debug: bool):
 async def main():
 	global tool_status
 	global original_client_locations
+	# On Python 3.12+, tasks run eagerly until they first suspend, so short-lived tasks skip a trip through the event loop
+	if hasattr(asyncio, 'eager_task_factory'):
+		asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
 	listener = HotkeyListener()
 	foreground_client: Client = None
 	background_clients = []
@@ -550,7 +554,7 @@ async def main():
 			else:
 				logger.debug(f'{toggle_speed_key} key pressed, enabling speed multiplier.')
 				gui_send_queue.put(deimosgui.GUICommand(deimosgui.GUICommandType.UpdateWindow, ('SpeedhackStatus', 'Enabled')))
-				speed_task = asyncio.create_task(try_task_coro(speed_switching, walker.clients))
+				speed_task = create_try_task(speed_switching, walker.clients)
 
 
 	async def friend_teleport_sync_hotkey():
@@ -581,7 +585,7 @@ async def main():
 				if debug:
 					logger.debug(f'{toggle_auto_combat_key} key pressed, enabling auto combat.')
 				gui_send_queue.put(deimosgui.GUICommand(deimosgui.GUICommandType.UpdateWindow, ('CombatStatus', 'Enabled')))
-				combat_task = asyncio.create_task(try_task_coro(combat_loop, walker.clients, True))
+				combat_task = create_try_task(combat_loop, walker.clients, True)
 
 
 	async def toggle_dialogue_hotkey(side_quests: bool = False):
@@ -604,7 +608,7 @@ async def main():
 					side_quest_log_str += " and auto side quests functionality"
 				logger.debug(f'{toggle_auto_dialogue_key} key pressed, enabling auto dialogue{side_quest_log_str}.')
 				gui_send_queue.put(deimosgui.GUICommand(deimosgui.GUICommandType.UpdateWindow, ('DialogueStatus', 'Enabled')))
-				dialogue_task = asyncio.create_task(try_task_coro(dialogue_loop, walker.clients, True))
+				dialogue_task = create_try_task(dialogue_loop, walker.clients, True)
 
 
 	async def toggle_dialogue_side_quests_hotkey():
@@ -643,7 +647,7 @@ async def main():
 					questing_task = None
 
 				gui_send_queue.put(deimosgui.GUICommand(deimosgui.GUICommandType.UpdateWindow, ('SigilStatus', 'Enabled')))
-				sigil_task = asyncio.create_task(try_task_coro(sigil_loop, walker.clients, True))
+				sigil_task = create_try_task(sigil_loop, walker.clients, True)
 
 
 
@@ -709,7 +713,7 @@ async def main():
 
 				logger.debug(f'{toggle_auto_questing_key} key pressed, enabling auto questing.')
 				gui_send_queue.put(deimosgui.GUICommand(deimosgui.GUICommandType.UpdateWindow, ('QuestingStatus', 'Enabled')))
-				questing_task = asyncio.create_task(try_task_coro(questing_loop, walker.clients, True))
+				questing_task = create_try_task(questing_loop, walker.clients, True)
 
 
 	async def toggle_auto_pet_hotkey():
@@ -730,7 +734,7 @@ async def main():
 			else:
 				logger.debug(f'Enabling auto pet.')
 				gui_send_queue.put(deimosgui.GUICommand(deimosgui.GUICommandType.UpdateWindow, ('Auto PetStatus', 'Enabled')))
-				auto_pet_task = asyncio.create_task(try_task_coro(auto_pet_loop, walker.clients, True))
+				auto_pet_task = create_try_task(auto_pet_loop, walker.clients, True)
 
 	# async def toggle_side_quests():
 	# 	global side_quest_status
@@ -800,22 +804,11 @@ async def main():
 			hotkey_status = False
 
 
-	async def foreground_client_switching():
-		await asyncio.sleep(2)
-		# enable hotkeys if a client is selected, disable if none are
-		while True:
-			await asyncio.sleep(0.1)
-			foreground_client_list = [c for c in walker.clients if c.is_foreground]
-			if foreground_client_list:
-				await enable_hotkeys(debug = True)
-			else:
-				await disable_hotkeys(debug = True)
-
-
 	async def assign_foreground_clients():
-		# assigns the foreground client and a list of background clients
+		# assigns the foreground client and a list of background clients, and enables hotkeys only while a client is selected
 		nonlocal foreground_client
 		nonlocal background_clients
+		hotkeys_start_time = time.time() + 2
 		while True:
 			foreground_client_list = [c for c in walker.clients if c.is_foreground]
 			# print(foreground_client_list)
@@ -824,7 +817,15 @@ async def main():
 			else:
 				# foreground_client = None
 				pass
-			background_clients = [c for c in walker.clients if not c.is_foreground and c != foreground_client]
+			background_clients = [c for c in walker.clients if c not in foreground_client_list and c != foreground_client]
+
+			# enable hotkeys if a client is selected, disable if none are
+			if time.time() >= hotkeys_start_time:
+				if foreground_client_list:
+					await enable_hotkeys(debug = True)
+				else:
+					await disable_hotkeys(debug = True)
+
 			await asyncio.sleep(0.1)
 
 
@@ -944,7 +945,7 @@ async def main():
 								await asyncio.sleep(1.0)
 
 								if questing_task is None:
-									questing_task = asyncio.create_task(try_task_coro(questing_loop, walker.clients, True))
+									questing_task = create_try_task(questing_loop, walker.clients, True)
 
 
 		await asyncio.gather(*[async_afk_questing(p) for p in walker.clients])
@@ -1533,6 +1534,7 @@ async def main():
 
 								if foreground_client:
 									flythrough_task = asyncio.create_task(_flythrough())
+									flythrough_task.add_done_callback(log_task_exception)
 
 							case deimosgui.GUICommandType.KillFlythrough:
 								if flythrough_task is not None and not flythrough_task.cancelled():
@@ -1561,13 +1563,16 @@ async def main():
 										else:
 											new_commands.append(command_str)
 
+									# blank and comment-only lines tokenize to nothing, so they're dropped once here instead of on every loop
+									tokenized_commands = [command_tokens for command_tokens in map(tokenize_command, new_commands) if command_tokens]
+
 									while True:
-										for command_str in new_commands:
-											await parse_command(walker.clients, command_str)
+										for command_tokens in tokenized_commands:
+											await execute_command(walker.clients, command_tokens)
 
 										await asyncio.sleep(1)
 
-								bot_task = asyncio.create_task(try_task_coro(run_bot, walker.clients, True))
+								bot_task = create_try_task(run_bot, walker.clients, True)
 
 							case deimosgui.GUICommandType.KillBot:
 								if bot_task is not None and not bot_task.cancelled():
@@ -1670,12 +1675,8 @@ async def main():
 								end_zone = None
 
 							if not end_zone:
-								area_list: list[str] = zone_list[-1].split('_')
-								del area_list[0]
-
-								for a in area_list.copy():
-									if any([s.isdigit() for s in a]):
-										area_list.remove(a)
+								# drop the leading zone prefix and any numbered area parts
+								area_list: list[str] = [a for a in zone_list[-1].split('_')[1:] if not any(s.isdigit() for s in a)]
 
 								seperator = ' '
 								area = seperator.join(area_list)
@@ -1920,7 +1921,6 @@ async def main():
 	tool_status = True
 	exc = None
 	try:
-		foreground_client_switching_task = asyncio.create_task(foreground_client_switching())
 		assign_foreground_clients_task = asyncio.create_task(assign_foreground_clients())
 		# speed_switching_task = asyncio.create_task(speed_switching())
 		# combat_loop_task = asyncio.create_task(combat_loop())
@@ -1941,7 +1941,6 @@ async def main():
 		# await asyncio.wait([foreground_client_switching_task, speed_switching_task, combat_loop_task, assign_foreground_clients_task, dialogue_loop_task, anti_afk_loop_task, sigil_loop_task, in_combat_loop_task, questing_leader_combat_detection_task, gui_task, potion_usage_loop_task, rpc_loop_task, drop_logging_loop_task, zone_check_loop_task])
 		done, _ = await asyncio.wait([
 			ban_watcher_task,
-			foreground_client_switching_task,
 			assign_foreground_clients_task,
 			anti_afk_loop_task,
 			in_combat_loop_task,
@@ -1961,7 +1960,7 @@ async def main():
 				raise exc
 
 	finally:
-		tasks: List[asyncio.Task] = [ban_watcher_task, foreground_client_switching_task, combat_task, assign_foreground_clients_task, dialogue_task, anti_afk_loop_task, sigil_task, questing_task, in_combat_loop_task, questing_leader_combat_detection_task, gui_task, potion_usage_loop_task, rpc_loop_task, drop_logging_loop_task, zone_check_loop_task, anti_afk_questing_loop_task]
+		tasks: List[asyncio.Task] = [ban_watcher_task, combat_task, assign_foreground_clients_task, dialogue_task, anti_afk_loop_task, sigil_task, questing_task, in_combat_loop_task, questing_leader_combat_detection_task, gui_task, potion_usage_loop_task, rpc_loop_task, drop_logging_loop_task, zone_check_loop_task, anti_afk_questing_loop_task]
 		for task in tasks:
 			if task is not None and not task.cancelled():
 				task.cancel()
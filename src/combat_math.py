@@ -1,4 +1,6 @@
-from typing import List, Coroutine, Any
+from typing import List, Coroutine, Any, Dict, Tuple
+import asyncio
+from functools import lru_cache
 import math
 from wizwalker import Client
 from wizwalker.combat import CombatMember
@@ -9,36 +11,83 @@ from src.combat_utils import add_universal_stat
 
 async def real_stat(stat_func: Coroutine[Any, Any, List[float]], uni_func: Coroutine[Any, Any, float]) -> List[float]:
     # Handles adding two stat reading coroutines
-    base_stats = await stat_func()
-    uni_stat = await uni_func()
+    base_stats, uni_stat = await asyncio.gather(stat_func(), uni_func())
 
     return add_universal_stat(base_stats, uni_stat)
 
 
+async def real_stat_at(stat_func: Coroutine[Any, Any, List[float]], uni_func: Coroutine[Any, Any, float], index: int) -> float:
+    # Handles adding two stat reading coroutines, only for the school at a given index
+    base_stats, uni_stat = await asyncio.gather(stat_func(), uni_func())
+
+    return base_stats[index] + uni_stat
+
+
+async def effect_atrs(effect: DynamicSpellEffect) -> List[Any]:
+    # Reads the attributes of an effect used in damage calculation, all at once
+    return await asyncio.gather(
+        effect.effect_param(),
+        effect.effect_type(),
+        effect.damage_type(),
+        effect.spell_template_id(),
+        effect.enchantment_spell_template_id()
+    )
+
+
+@lru_cache
+def curve_constants(l: float, k0: float, n0: float) -> Tuple[float, float]:
+    # Returns k and n of the stat curve. These only depend on the duel's curve parameters, so they're cached.
+    limit = l * 100
+
+    # Calculate k, thank you charlied134 and Major
+    if k0 != 0:
+        k = math.log(limit / (limit - k0)) / k0
+    else:
+        k = 1 / limit
+
+    # Calculate n, thank you charlied134 and Major
+    n = math.log(1 - (k0 + n0) / limit) + k * (k0 + n0)
+
+    return k, n
+
+
 def curve_stat(stat: float, l: float, k0: float, n0: float) -> float:
     # Curves a stat in the same way the game does with resist and damage values past a certain intersection (starting point of the limit)
     if stat > (k0 + n0) / 100:
-        limit = l * 100
+        k, n = curve_constants(l, k0, n0)
+        stat = l - l * math.exp(-1 * k * (stat * 100) + n)
 
-        # Calculate k, thank you charlied134 and Major
-        if k0 != 0:
-            k = math.log(limit / (limit - k0)) / k0
-        else:
-            k = 1 / limit
+    return stat
 
-        # Calculate n, thank you charlied134 and Major
-        n = math.log(1 - (k0 + n0) / limit) + k * (k0 + n0)
 
-        stat = l - l * math.e ** (-1 * k * (stat * 100) + n)
+# Duel curve parameters per client, tagged with the duel base address they were read from
+# (damage_limit, d_k0, d_n0, resist_limit, r_k0, r_n0)
+duel_curve_cache: Dict[int, Tuple[int, Tuple[float, float, float, float, float, float]]] = {}
 
-    return stat
+
+async def duel_curve_params(client: Client) -> Tuple[float, float, float, float, float, float]:
+    # Returns the damage and resist curve parameters of the current duel. These don't change during a duel, so they're only re-read once the duel changes.
+    duel_address = await client.duel.read_base_address()
+    cached = duel_curve_cache.get(id(client))
+    if cached and cached[0] == duel_address:
+        return cached[1]
+
+    params = tuple(await asyncio.gather(
+        client.duel.damage_limit(),
+        client.duel.d_k0(),
+        client.duel.d_n0(),
+        client.duel.resist_limit(),
+        client.duel.r_k0(),
+        client.duel.r_n0()
+    ))
+    duel_curve_cache[id(client)] = (duel_address, params)
+
+    return params
 
 
 async def curve_damage(client: Client, member: CombatMember, damage: float) -> float:
     if await member.is_player():
-        l = await client.duel.damage_limit()
-        k0 = await client.duel.d_k0()
-        n0 = await client.duel.d_n0()
+        l, k0, n0, _, _, _ = await duel_curve_params(client)
 
         return curve_stat(damage, l, k0, n0)
 
@@ -47,9 +96,7 @@ async def curve_damage(client: Client, member: CombatMember, damage: float) -> f
 
 async def curve_resist(client: Client, member: CombatMember, resist: float) -> float:
     if await member.is_player():
-        l = await client.duel.resist_limit()
-        k0 = await client.duel.r_k0()
-        n0 = await client.duel.r_n0()
+        _, _, _, l, k0, n0 = await duel_curve_params(client)
 
         return curve_stat(resist, l, k0, n0)
 
@@ -60,77 +107,52 @@ async def base_damage_calculation_from_id(client: Client, members: List[CombatMe
     # Calculates damage from given base damage value, and is the basis for both exact and damage potential calculation. Works based off of IDs.
 
     # Get base objects from ID arguments
-    caster = await id_to_member(caster_id, members)
-    target = await id_to_member(target_id, members)
+    caster, target = await asyncio.gather(id_to_member(caster_id, members), id_to_member(target_id, members))
 
-    # Caster-specific objects
-    caster_stats = await caster.get_stats()
     # Charms use FIFO (queue behavior) in game, but the first applied blades show up at the bottom of this list.
-    caster_effects: List[DynamicSpellEffect] = await get_total_effects(caster_id, members)
-    caster_effects.reverse()
-
-    # Target-specific objects
-    target_stats = await target.get_stats()
     # Traps/Shields use LIFO (stack behavior) in game.
-    target_effects: List[DynamicSpellEffect] = await get_total_effects(target_id, members)
+    caster_stats, target_stats, caster_effects, target_effects = await asyncio.gather(
+        caster.get_stats(),
+        target.get_stats(),
+        get_total_effects(caster_id, members),
+        get_total_effects(target_id, members)
+    )
+    caster_effects.reverse()
 
     # Global effects
-    caster_effects.append(global_effect)
-    target_effects.append(global_effect)
-
-    # Caster Stats
-    caster_damages = await real_stat(caster_stats.dmg_bonus_percent, caster_stats.dmg_bonus_percent_all)
-    caster_flat_damages = await real_stat(caster_stats.dmg_bonus_flat, caster_stats.dmg_bonus_flat_all)
-    caster_crits = await real_stat(caster_stats.critical_hit_rating_by_school, caster_stats.critical_hit_rating_all)
-    caster_pierces = await real_stat(caster_stats.ap_bonus_percent, caster_stats.ap_bonus_percent_all)
-    caster_level = await caster.level()
-
-    # Target Stats
-    target_resistances = await real_stat(target_stats.dmg_reduce_percent, target_stats.dmg_reduce_percent_all)
-    target_flat_resistances = await real_stat(target_stats.dmg_reduce_flat, target_stats.dmg_reduce_flat_all)
-    target_blocks = await real_stat(target_stats.block_rating_by_school, target_stats.block_rating_all)
-
-    # Break up caster hanging effect objects
-    caster_effect_atrs = []
-    for effect in caster_effects.copy():
-        if effect:
-            curr_effect_atr = [
-                await effect.effect_param(),
-                await effect.effect_type(),
-                await effect.damage_type(),
-                await effect.spell_template_id(),
-                await effect.enchantment_spell_template_id()
-            ]
-
-            caster_effect_atrs.append(curr_effect_atr)
-
-        else:
-            caster_effects.remove(effect)
-
-    target_effect_atrs = []
-    for effect in target_effects.copy():
-        if effect:
-            curr_effect_atr = [
-                await effect.effect_param(),
-                await effect.effect_type(),
-                await effect.damage_type(),
-                await effect.spell_template_id(),
-                await effect.enchantment_spell_template_id()
-            ]
-
-            target_effect_atrs.append(curr_effect_atr)
-
-        else:
-            target_effects.remove(effect)
+    if global_effect is not None:
+        caster_effects.append(global_effect)
+        target_effects.append(global_effect)
 
     initial_damage_type = damage_type
     initial_damage_type_index = school_list_ids[damage_type]
 
-    # Relevant caster stats for the damage type
-    caster_damage = caster_damages[initial_damage_type_index]
-    caster_flat_damages = caster_flat_damages[initial_damage_type_index]
-    caster_crit = caster_crits[initial_damage_type_index]
-    caster_pierce = caster_pierces[initial_damage_type_index]
+    # Caster stats are only relevant for the initial damage type, target stats are indexed once the final damage type is known
+    (
+        caster_damage,
+        caster_flat_damage,
+        caster_crit,
+        caster_pierce,
+        caster_level,
+        target_resistances,
+        target_flat_resistances,
+        target_blocks
+    ) = await asyncio.gather(
+        real_stat_at(caster_stats.dmg_bonus_percent, caster_stats.dmg_bonus_percent_all, initial_damage_type_index),
+        real_stat_at(caster_stats.dmg_bonus_flat, caster_stats.dmg_bonus_flat_all, initial_damage_type_index),
+        real_stat_at(caster_stats.critical_hit_rating_by_school, caster_stats.critical_hit_rating_all, initial_damage_type_index),
+        real_stat_at(caster_stats.ap_bonus_percent, caster_stats.ap_bonus_percent_all, initial_damage_type_index),
+        caster.level(),
+        real_stat(target_stats.dmg_reduce_percent, target_stats.dmg_reduce_percent_all),
+        real_stat(target_stats.dmg_reduce_flat, target_stats.dmg_reduce_flat_all),
+        real_stat(target_stats.block_rating_by_school, target_stats.block_rating_all)
+    )
+
+    # Break up hanging effect objects
+    caster_effect_atrs, target_effect_atrs = await asyncio.gather(
+        asyncio.gather(*[effect_atrs(effect) for effect in caster_effects]),
+        asyncio.gather(*[effect_atrs(effect) for effect in target_effects])
+    )
 
     # Curve damage stats
     curved_caster_damage = await curve_damage(client, caster, caster_damage)
@@ -138,7 +160,7 @@ async def base_damage_calculation_from_id(client: Client, members: List[CombatMe
 
     # Applying curved damage and flat damage
     damage *= curved_caster_damage
-    damage += caster_flat_damages
+    damage += caster_flat_damage
 
     # outgoing hanging effects (caster)
     seen_caster_effect_template_ids = set()
@@ -217,18 +239,19 @@ async def base_damage_calculation_from_id(client: Client, members: List[CombatMe
     # calculates critical multiplier and chance
     # This assumes that caster crit uses the initial damage school, but target block applies to the final damage school.
     if caster_crit > 0:
-        if caster_level > 100:
-            caster_level = 100
+        caster_level = min(caster_level, 100)
 
-        crit_damage_multiplier = (2 - (target_block / ((caster_crit / 3) + target_block)))
+        # A negative block stat that exactly cancels out the caster's crit would divide by zero, treat that as no crit
+        crit_denominator = (caster_crit / 3) + target_block
+        crit_damage_multiplier = (2 - (target_block / crit_denominator)) if crit_denominator != 0 else 1
         client_school_critical = (0.03 * caster_level * caster_crit)
         mob_block = (3 * caster_crit + target_block)
-        crit_chance = client_school_critical / mob_block
+        crit_chance = client_school_critical / mob_block if mob_block != 0 else 0
 
         # applying the crit multiplier if the chance is above a certain threshold
         # TODO: Express both the crit & non-crit values, along with the crit percentage.
-        if (crit_chance >= 0.85 and force_crit is None) or force_crit:
-            damage *= crit_damage_multiplier
+        crit_applied = bool((crit_chance >= 0.85 and force_crit is None) or force_crit)
+        damage *= 1 + (crit_damage_multiplier - 1) * crit_applied
 
     # Apply flat resist
     damage -= target_flat_resist
@@ -1,5 +1,6 @@
 import traceback
 from asyncio import CancelledError
+from functools import partial
 from typing import Dict, List, Tuple, Coroutine
 import asyncio
 from wizwalker import Client, XYZ, Orient, Keycode
@@ -9,7 +10,7 @@ from wizwalker.memory.memory_objects.camera_controller import CameraController
 
 from src.sprinty_client import SprintyClient
 from src.gui_inputs import is_numeric, param_input
-from src.utils import read_webpage, index_with_str, get_window_from_path, teleport_to_friend_from_list, auto_potions_force_buy, use_potion, is_free, logout_and_in, click_window_by_path, wait_for_visible_by_path, refill_potions, refill_potions_if_needed, wait_for_zone_change
+from src.utils import read_webpage, index_with_str, get_window_from_path, teleport_to_friend_from_list, auto_potions_force_buy, use_potion, is_free, logout_and_in, click_window_by_path, is_visible_by_path, refill_potions, refill_potions_if_needed, wait_for_zone_change
 from src.camera_utils import glide_to, point_to_xyz, rotating_glide_to, orbit
 from src.tokenizer import tokenize
 # from src.collision_math import plot_cube
@@ -59,20 +60,16 @@ def handle_index(input_list, i: int = 0, default = None):
         return input_list[i]
 
 
-def client_from_titles(clients: List[Client], title_str: str = 'p1') -> Client:
-    # Returns a Client object based off matching the window title.
-    return [client for client in clients if client.title.lower() == title_str][0]
+async def wait_for_coros(coros: List[Coroutine], wait_for_not: bool = False, interval: float = 0.25):
+    # Waits for every Coroutine to return True, or return False if wait_for_not is True. All of them share one poll timer, and each stops being polled once it has returned the desired value.
+    pending = list(coros)
+    while True:
+        results = await asyncio.gather(*[coro() for coro in pending])
+        pending = [coro for coro, result in zip(pending, results) if bool(result) == wait_for_not]
+        if not pending:
+            return
 
-
-async def wait_for_coro(coro: Coroutine, wait_for_not: bool = False, interval: float = 0.25):
-    # Waits for a Coroutine to return True, or return False if wait_for_not is True.
-    if wait_for_not:
-        while await coro():
-            await asyncio.sleep(interval)
-
-    else:
-        while not await coro():
-            await asyncio.sleep(interval)
+        await asyncio.sleep(interval)
 
 
 # def find_path(commands: List[str], starting_index: int = 2) -> List[str]:
@@ -110,9 +107,8 @@ async def wait_for_coro(coro: Coroutine, wait_for_not: bool = False, interval: f
 #     return result
 
 
-async def parse_command(clients: List[Client], command_str: str):
-    # Executes a single raw command string for the bot creator.
-    all_clients = clients.copy()
+def tokenize_command(command_str: str) -> List[str]:
+    # Tokenizes a single raw command string for the bot creator. Bot loops should do this once per line, not once per execution.
     command_str = command_str.replace(', ', ',')
 
     check_strings = ['tozone', 'to_zone', 'waitforzonechange', 'wait_for_zone_change']
@@ -120,7 +116,12 @@ async def parse_command(clients: List[Client], command_str: str):
     if not any(substring in command_str for substring in check_strings):
         command_str = command_str.replace('_', '')
 
-    split_command = tokenize(command_str)
+    return tokenize(command_str)
+
+
+async def execute_command(clients: List[Client], split_command: List[str]):
+    # Executes a single tokenized command for the bot creator. The tokens are not modified, so they can be reused.
+    all_clients = clients
 
     if not split_command:
         return
@@ -138,9 +139,12 @@ async def parse_command(clients: List[Client], command_str: str):
         case 'log' | 'debug' | 'print':
             # Logs a specific message or prints the text of a window (by path, if any)
             if len(split_command) >= 3 and split_command[1].lower() == 'window' and type(split_command[2]) == list:
-                for client in clients:
+                async def _read_window_text(client: Client) -> str:
                     desired_window = await get_window_from_path(client.root_window, split_command[2])
-                    relevant_string = await desired_window.maybe_text()
+                    return await desired_window.maybe_text()
+
+                relevant_strings = await asyncio.gather(*[_read_window_text(client) for client in clients])
+                for client, relevant_string in zip(clients, relevant_strings):
                     logger.debug(f'{client.title} - {relevant_string}')
 
             else:
@@ -151,22 +155,19 @@ async def parse_command(clients: List[Client], command_str: str):
             client_str = split_command[0].replace(' ', '')
             exclude = False
             if 'except' in client_str:
-                split_command.pop(0)
+                split_command = split_command[1:]
                 client_str = split_command[0]
                 exclude = True
 
             if 'mass' not in client_str:
                 # Allows for specific clients to be used via a : seperator. Example: p1:p3:p4   , except p2
-                if ':' in client_str:
-                    split_clients = client_str.split(':')
-                    provided_clients = [client_from_titles(all_clients.copy(), title) for title in split_clients]
-                else:
-                    provided_clients = [client_from_titles(all_clients, client_str)]
+                clients_by_title = {client.title.lower(): client for client in all_clients}
+                provided_clients = [clients_by_title[title] for title in client_str.split(':')]
 
                 if is_numeric(client_str[1]):
                     if exclude:
                         # Sets client list equal to all clients except specified ones
-                        clients = [client for client in all_clients.copy() if client not in provided_clients]
+                        clients = [client for client in all_clients if client not in provided_clients]
                     else:
                         clients = provided_clients
 
@@ -179,7 +180,8 @@ async def parse_command(clients: List[Client], command_str: str):
                             await asyncio.gather(*[SprintyClient(p).tp_to_closest_mob() for p in clients])
 
                         case 'quest' | 'questpos' | 'questposition':
-                            await asyncio.gather(*[p.teleport(await clients[0].quest_position.position()) for p in clients])
+                            quest_xyz = await clients[0].quest_position.position()
+                            await asyncio.gather(*[p.teleport(quest_xyz) for p in clients])
 
                         case _:
                             client_location = None
@@ -191,19 +193,15 @@ async def parse_command(clients: List[Client], command_str: str):
 
                             # a client title was not provided - user likely listed an actual XYZ coordinate
                             if client_location is None:
-                                xyzs = []
-                                for client in clients:
-                                    client_xyzs, _ = await parse_location(split_command, client=client)
-                                    xyzs.append(client_xyzs[0])
+                                locations = await asyncio.gather(*[parse_location(split_command, client=client) for client in clients])
+                                xyzs = [client_xyzs[0] for client_xyzs, _ in locations]
 
                                 await asyncio.gather(*[client.teleport(xyz) for client, xyz in zip(clients, xyzs)])
 
                 case 'walkto' | 'goto':
                     # Walks in a straight line to a given XYZ (Z agnostic)
-                    xyzs = []
-                    for client in clients:
-                        client_xyzs, _ = await parse_location(split_command, client=client)
-                        xyzs.append(client_xyzs[0])
+                    locations = await asyncio.gather(*[parse_location(split_command, client=client) for client in clients])
+                    xyzs = [client_xyzs[0] for client_xyzs, _ in locations]
                     await asyncio.gather(*[client.goto(xyz.x, xyz.y) for client, xyz in zip(clients, xyzs)])
 
                 case 'sendkey' | 'press' | 'presskey':
@@ -217,19 +215,19 @@ async def parse_command(clients: List[Client], command_str: str):
 
                 case 'waitfordialog' | 'waitfordialogue':
                     # Waits for dialogue window to appear
-                    await asyncio.gather(*[wait_for_coro(client.is_in_dialog) for client in clients])
+                    await wait_for_coros([client.is_in_dialog for client in clients])
 
                     if split_command[1].lower() == 'completion':
                         # Waits for dialogue window to disappear
-                        await asyncio.gather(*[wait_for_coro(client.is_in_dialog, True) for client in clients])
+                        await wait_for_coros([client.is_in_dialog for client in clients], True)
 
                 case 'waitforbattle' | 'waitforcombat':
                     # Waits for combat
-                    await asyncio.gather(*[wait_for_coro(client.in_battle) for client in clients])
+                    await wait_for_coros([client.in_battle for client in clients])
 
                     if split_command[-1].lower() == 'completion':
                         # Waits for combat to end
-                        await asyncio.gather(*[wait_for_coro(client.in_battle, True) for client in clients])
+                        await wait_for_coros([client.in_battle for client in clients], True)
 
                 case 'waitforzonechange' | 'wait_for_zone_change':
                     # waits for zone to change from the provided zone name
@@ -244,24 +242,16 @@ async def parse_command(clients: List[Client], command_str: str):
 
                         if split_command[-1].lower() == 'completion':
                             # Waits for loading screen to end
-                            await asyncio.gather(*[wait_for_coro(client.is_loading, True) for client in clients])
+                            await wait_for_coros([client.is_loading for client in clients], True)
 
                 case 'waitforfree':
                     # Waits for is_free to return True
-                    async def _wait_for_free(client: Client, wait_for_not: bool = False, interval: float = 0.25):
-                        if wait_for_not:
-                            while await is_free(client):
-                                await asyncio.sleep(interval)
-
-                        else:
-                            while not await is_free(client):
-                                await asyncio.sleep(interval)
-
-                    await asyncio.gather(*[_wait_for_free(client) for client in clients])
+                    free_checks = [partial(is_free, client) for client in clients]
+                    await wait_for_coros(free_checks)
 
                     if split_command[-1].lower() == 'completion':
                         # Waits for is_free to return False
-                        await asyncio.gather(*[_wait_for_free(client, True) for client in clients])
+                        await wait_for_coros(free_checks, True)
 
                 case 'usepotion':
                     # Uses a potion
@@ -299,10 +289,11 @@ async def parse_command(clients: List[Client], command_str: str):
 
                 case 'waitforwindow' | 'waitforpath':
                     # Waits for a specific window (by path) to be visible
-                    await asyncio.gather(*[wait_for_visible_by_path(client, split_command[2]) for client in clients])
+                    visibility_checks = [partial(is_visible_by_path, client, split_command[2]) for client in clients]
+                    await wait_for_coros(visibility_checks)
                     if type(split_command[-1]) == str and split_command[-1].lower() == 'completion':
                         # Waits for a specific window (by path) to not be visible
-                        await asyncio.gather(*[wait_for_visible_by_path(client, split_command[2], True) for client in clients])
+                        await wait_for_coros(visibility_checks, True)
 
                 case 'friendtp' | 'friendteleport':
                     # Teleports specified clients to another via wizard name or icon
@@ -105,6 +105,8 @@ class GUIKeys:
 
 
 class GUICommand:
+	__slots__ = ("com_type", "data")
+
 	def __init__(self, com_type: GUICommandType, data=None):
 		self.com_type = com_type
 		self.data = data
@@ -1,5 +1,6 @@
 import asyncio
 import time
+from functools import lru_cache
 import traceback
 import math
 
@@ -10,7 +11,7 @@ from src.auto_pet import auto_pet
 from src.teleport_math import *
 from wizwalker import XYZ, Keycode, MemoryReadError, Client, Rectangle, HookAlreadyActivated, HookNotActive
 from wizwalker.file_readers.wad import Wad
-from wizwalker.memory import DynamicClientObject
+from wizwalker.memory import DynamicClientObject, Window
 from wizwalker.extensions.scripting import teleport_to_friend_from_list
 from src.sprinty_client import SprintyClient
 from src.utils import *
@@ -18,7 +19,50 @@ from src.paths import *
 from fuzzywuzzy import fuzz
 
 
+# 'Collect Cog in Triton Avenue (0 of 3)' -> 'Cog'
+collect_object_name_pattern = re.compile(r"\w+\s+(.*)\s+in.*")
+
+
+@lru_cache(maxsize=64)
+def collect_quest_object_name(quest_text: str) -> str:
+    # Parses the object name out of a collect quest's text. Quest text rarely changes between calls, so results are cached.
+    res = collect_object_name_pattern.search(quest_text)
+    if res is None:
+        return ''
+    return res.group(1).strip()
+
+
+@lru_cache(maxsize=64)
+def quest_zone_name(quest_text: str) -> str:
+    # Parses the zone name out of a quest's text. Quest text rarely changes between calls, so results are cached.
+    stopwords = ['<center>','</center>']
+    querywords = quest_text.split()
+    resultwords  = [word for word in querywords if word.lower() not in stopwords]
+
+    # 'Collect Cog in Triton Avenue (0 of 3)' -> 'Triton Avenue'
+    # The zone is everything after the first 'in' that isn't the first or last word, up to the quest progress
+    for i in range(1, len(resultwords) - 1):
+        if resultwords[i] == 'in':
+            return ' '.join(resultwords[i + 1:]).partition('(')[0].strip()
+
+    return ''
+
+
+# Key - truncated quest name
+# Values - 0: time between entity respawns, 1-... : xyz locations of separate entities belonging to the quest
+# TODO: Get rid of this once scripting system allows for quest libraries
+incompatible_hardcoded_quests = {
+    'find submarine parts in the floating land': [40, XYZ(x=-17412.53515625, y=10505.794921875, z=-429.19927978515625), XYZ(x=-17088.447265625, y=12284.244140625, z=-410.1100769042969), XYZ(x=-21681.78125, y=11547.5966796875, z=-429.19927978515625)]
+    , 'collect sea cucumbers in pitch black lake': [40, XYZ(x=-8995.333984375, y=-830.6781616210938, z=-97.31965637207031), XYZ(x=-9911.9404296875, y=823.7628173828125, z=-97.31971740722656), XYZ(x=-11497.998046875, y=-1030.2618408203125, z=-97.32334899902344), XYZ(x=-12099.0517578125, y=-4674.13623046875, z=-96.95536804199219), XYZ(x=-14215.37109375, y=-4371.93798828125, z=-97.32661437988281), XYZ(x=-14287.5556640625, y=-2835.4814453125, z=-97.3197021484375)]
+    , 'catch vonda fish in pitch black lake': [3, XYZ(x=-10030.9912109375, y=-7925.51953125, z=-347.3206787109375)]
+    , 'break mining equipment in tyrian gorge': [25, XYZ(x=-2529.12890625, y=-3015.832763671875, z=-906.33837890625), XYZ(x=-3181.15234375, y=-6233.39306640625, z=-924.6146240234375), XYZ(x=1495.8695068359375, y=-7369.19580078125, z=-905.3265380859375), XYZ(x=-204.098876953125, y=-8468.421875, z=236.10702514648438), XYZ(x=2508.4169921875, y=-4712.10302734375, z=-1232.338134765625)]
+    , 'steal barrel of kermes fire in tyrian gorge': [35, XYZ(x=1352.575927734375, y=-4787.16552734375, z=-1098.1168212890625), XYZ(x=-1936.0185546875, y=-3954.15380859375, z=-1077.83837890625), XYZ(x=-1820.606201171875, y=-6331.4541015625, z=-1077.849853515625), XYZ(x=517.3740844726562, y=-7042.94287109375, z=-1077.84130859375), XYZ(x=-4628.16650390625, y=-5603.2578125, z=-906.51318359375), XYZ(x=-3216.014892578125, y=-5965.7412109375, z=-932.0715942382812), XYZ(x=-1106.3753662109375, y=-3800.721923828125, z=-905.3256225585938), XYZ(x=-451.9595031738281, y=-4547.75537109375, z=-905.325927734375)]
+}
+
+
 class Quester():
+    __slots__ = ("client", "clients", "leader_pid", "current_leader_client", "current_leader_pid", "d_location", "quest_name_windows")
+
     def __init__(self, client: Client, clients: list[Client], leader_pid: int):
         self.client = client
         self.clients = clients
@@ -26,12 +70,41 @@ class Quester():
         self.current_leader_client = client
         self.current_leader_pid = leader_pid
         self.d_location = None
+        self.quest_name_windows: dict[Client, tuple[str, Window]] = {}
+
+    async def get_quest_name_window(self, client: Client) -> Window:
+        # the held quest name window is only reused within the zone it was found in, and only while it still reads back as a visible txtGoalName
+        # otherwise the ui tree is walked again and whatever is found there replaces it
+        zone = await client.zone_name()
+        cached = self.quest_name_windows.get(client)
+        if cached is not None and cached[0] == zone:
+            try:
+                if await cached[1].name() == quest_name_path[-1] and await cached[1].is_visible():
+                    return cached[1]
+            except MemoryReadError:
+                pass
+
+        window = await find_quest_name_window(client)
+        if window:
+            self.quest_name_windows[client] = (zone, window)
+        else:
+            self.quest_name_windows.pop(client, None)
+        return window
+
+    async def read_quest_name(self, client: Client) -> str:
+        try:
+            return await get_quest_name(client, self.get_quest_name_window)
+        except MemoryReadError:
+            # the held window went stale without a zone change, forget it and look the quest up from the root
+            self.quest_name_windows.pop(client, None)
+            return await get_quest_name(client)
 
     async def read_quest_txt(self, client: Client) -> str:
         try:
-            quest_name = await get_window_from_path(client.root_window, quest_name_path)
+            quest_name = await self.get_quest_name_window(client)
             quest = await quest_name.maybe_text()
         except:
+            self.quest_name_windows.pop(client, None)
             quest = ""
         return quest
 
@@ -82,11 +155,7 @@ class Quester():
     async def get_collect_quest_object_name(self) -> str:
         # '<center>Collect Cog in Triton Avenue (0 of 3)</center>'
         # -> 'Cog'
-        s = await self.read_quest_txt(self.client)
-        res = re.findall(r"\w+\s+(.*)\s+in.*", s)
-        if len(res) == 0:
-            return ''
-        return res[0].strip()
+        return collect_quest_object_name(await self.read_quest_txt(self.client))
 
     # TODO: Does this need a client?
     async def get_quest_zone_name(self, c: Client) -> str:
@@ -94,20 +163,10 @@ class Quester():
         # Collect Cog in Triton Avenue (0 of 3)
         # -> 'Triton Avenue'
 
-        query = await self.read_quest_txt(c)
-
-        stopwords = ['<center>','</center>']
-        querywords = query.split()
-        resultwords  = [word for word in querywords if word.lower() not in stopwords]
-        s = ' '.join(resultwords)
-
-        res = re.findall(r"\s+in\s+([^\(]*)", s)
-        if len(res) == 0:
-            return ''
-        return res[0].strip()
+        return quest_zone_name(await self.read_quest_txt(c))
 
     async def get_truncated_quest_objectives(self, p: Client) -> str:
-        quest_objective = await get_quest_name(p)
+        quest_objective = await self.read_quest_name(p)
         if '(' in quest_objective:
             quest_objective = quest_objective.split('(', 1)
             quest_objective = quest_objective[0]
@@ -118,11 +177,8 @@ class Quester():
         return Wad.from_game_data(path.replace("/", "-"))
 
     async def followers_in_correct_zone(self) -> bool:
-        zone = await self.current_leader_client.zone_name()
-        for c in self.clients:
-            if await c.zone_name() != zone:
-                return False
-        return True
+        zone, *client_zones = await asyncio.gather(self.current_leader_client.zone_name(), *[c.zone_name() for c in self.clients])
+        return all(c_zone == zone for c_zone in client_zones)
 
     async def determine_solo_zone(self) -> bool:
         sprinter = SprintyClient(self.current_leader_client)
@@ -188,8 +244,7 @@ class Quester():
 
         for c in self.clients:
             if c.process_id != self.current_leader_pid:
-                c_zone = await c.zone_name()
-                leader_zone = await self.current_leader_client.zone_name()
+                c_zone, leader_zone = await asyncio.gather(c.zone_name(), self.current_leader_client.zone_name())
                 if c_zone != leader_zone or maybe_solo_zone:
                     if await is_free(c) and not c.entity_detect_combat_status:
                         # teleport to leader
@@ -207,7 +262,7 @@ class Quester():
 
                                     # if leader is in solo zone, others may be too - meaning the user is likely trying to quest multiple clients at the same time.  Keep track of these questing clients
                                     for p in self.clients:
-                                        if await p.zone_name() == await self.current_leader_client.zone_name():
+                                        if await p.zone_name() == solo_zone:
                                             clients_in_solo_zone.append(p)
 
                                     break
@@ -230,7 +285,7 @@ class Quester():
 
                                 # if leader is in solo zone, others may be too - meaning the user is likely trying to quest multiple clients at the same time.  Keep track of these questing clients
                                 for p in self.clients:
-                                    if await p.zone_name() == await self.current_leader_client.zone_name():
+                                    if await p.zone_name() == solo_zone:
                                         clients_in_solo_zone.append(p)
 
                                 break
@@ -280,8 +335,11 @@ class Quester():
 
                     # loop until we have confirmed that we are no longer in a solo zone
                     while len(clients_in_solo_zone) > 0 and solo_zone is not None:
-                        solo_zone_task = asyncio.create_task(solo_zone_questing_loop(clients_in_solo=clients_in_solo_zone, zone=solo_zone))
-                        await asyncio.wait([solo_zone_task])
+                        # awaited in place rather than through a task - an error in one solo pass should not stop us from regrouping
+                        try:
+                            await solo_zone_questing_loop(clients_in_solo=clients_in_solo_zone, zone=solo_zone)
+                        except Exception:
+                            traceback.print_exc()
 
                         logger.debug('Clients may have left the solo zone - attempting to teleport to leader.')
                         clients_in_solo_zone, solo_zone = await self.friend_teleport(maybe_solo_zone=True)
@@ -583,9 +641,9 @@ class Quester():
             original_length = len(client_quests)
             if len(client_quests) > 0:
                 for c in questing_clients:
-                    if c in client_quests:
-                        if await self.get_truncated_quest_objectives(c) != client_quests.get(c):
-                            client_quests.pop(c)
+                    quest = client_quests.get(c)
+                    if quest is not None and await self.get_truncated_quest_objectives(c) != quest:
+                        client_quests.pop(c)
 
                 # if all clients have moved on from their previous quest
                 if len(client_quests) == 0:
@@ -600,8 +658,8 @@ class Quester():
 
                 elif len(client_quests) < original_length:
                     # pass leader to next client in dict
-                    logger.debug('client(s) fell behind - new leader ' + list(client_quests)[0].title + ' assigned')
-                    self.current_leader_client = list(client_quests)[0]
+                    self.current_leader_client = next(iter(client_quests))
+                    logger.debug('client(s) fell behind - new leader ' + self.current_leader_client.title + ' assigned')
                     self.current_leader_pid = self.current_leader_client.process_id
                     follower_clients = await self.get_follower_clients()
             else:
@@ -847,11 +905,12 @@ class Quester():
             await asyncio.sleep(.1)
 
     async def teleport_to_quest(self, hitting_client: str, follower_clients: list[Client]):
+        # the leader is only reassigned by determine_new_leader_and_followers, so it can be bound once
+        leader_client = self.current_leader_client
         await asyncio.gather(*[self.leader_wait_for_free(p) for p in self.clients])
 
-        if await is_free_leader_questing(self.current_leader_client):
-            leader_client_objective_xyz = await self.current_leader_client.quest_position.position()
-            leader_objective = await self.get_truncated_quest_objectives(self.current_leader_client)
+        if await is_free_leader_questing(leader_client):
+            leader_client_objective_xyz, leader_objective = await asyncio.gather(leader_client.quest_position.position(), self.get_truncated_quest_objectives(leader_client))
 
             # complex teleport logic for defeat quests to prevent mob battle separation
             if 'defeat' in leader_objective.lower():
@@ -861,14 +920,14 @@ class Quester():
                 proxy_leader_is_questing = True
                 if hitting_client is not None:
                     # this is solely for cases where the user made a stupid config file and made their leader client the same as their hitter client
-                    if hitting_client in self.current_leader_client.title:
+                    if hitting_client in leader_client.title:
                         ignore_hitter = False
                         followup_teleport_clients = follower_clients.copy()
                         proxy_leader_client = None
                         for c in follower_clients:
                             # prefer other concurrent questers as the proxy leader (in case we run into a solo zone)
                             if proxy_leader_client is None:
-                                if await self.get_truncated_quest_objectives(c) == await self.get_truncated_quest_objectives(self.current_leader_client):
+                                if await self.get_truncated_quest_objectives(c) == leader_objective:
                                     proxy_leader_client = c
                                     break
 
@@ -879,18 +938,17 @@ class Quester():
                             proxy_leader_client = follower_clients[0]
 
                         followup_teleport_clients.remove(proxy_leader_client)
-                        followup_teleport_clients.append(self.current_leader_client)
+                        followup_teleport_clients.append(leader_client)
 
                 # user did not set a hitter client or the hitter client is not the current leader
                 # in this case, change nothing - leader remains leader and followers remain followers
                 if ignore_hitter:
-                    proxy_leader_client = self.current_leader_client
+                    proxy_leader_client = leader_client
                     followup_teleport_clients = follower_clients
 
-                logger.debug('Leader ' + self.current_leader_client.title + ' on defeat quest - staggering teleports')
+                logger.debug('Leader ' + leader_client.title + ' on defeat quest - staggering teleports')
 
-                location_before_sendback = await proxy_leader_client.body.position()
-                zone_before_teleport = await proxy_leader_client.zone_name()
+                location_before_sendback, zone_before_teleport = await asyncio.gather(proxy_leader_client.body.position(), proxy_leader_client.zone_name())
                 await proxy_leader_client.teleport(leader_client_objective_xyz)
                 await asyncio.sleep(1.0)
 
@@ -900,20 +958,20 @@ class Quester():
                 # leader client collided and got sent back
                 if distance < 20:
                     logger.debug('client ' + proxy_leader_client.title + ' collided on initial teleport')
-                    await navmap_tp_leader_quest(client=proxy_leader_client, xyz=leader_client_objective_xyz, leader_client=self.current_leader_client)
+                    await navmap_tp_leader_quest(client=proxy_leader_client, xyz=leader_client_objective_xyz, leader_client=leader_client)
 
                 await asyncio.sleep(1.0)
                 while await proxy_leader_client.is_loading():
                     await asyncio.sleep(.1)
 
-                # leader_current_zone = await self.current_leader_client.zone_name()
+                # leader_current_zone = await leader_client.zone_name()
                 detected_dungeon = await self.detected_interact_from_popup(proxy_leader_client)
 
                 # changed zones or we are in front of an interactible
                 if await proxy_leader_client.zone_name() != zone_before_teleport or detected_dungeon:
                     logger.debug('leader zone changed or interactible reached - syncing all clients')
                     try:
-                        await asyncio.gather(*[navmap_tp_leader_quest(client=c, xyz=leader_client_objective_xyz, leader_client=self.current_leader_client) for c in followup_teleport_clients])
+                        await asyncio.gather(*[navmap_tp_leader_quest(client=c, xyz=leader_client_objective_xyz, leader_client=leader_client) for c in followup_teleport_clients])
                     except:
                         print(traceback.print_exc())
 
@@ -942,9 +1000,10 @@ class Quester():
             # if we aren't doing a mob / boss fight, we have no need to stagger teleports
             # furthermore staggered teleports can break certain quests in dungeons for certain clients
             else:
-                await asyncio.gather(*[navmap_tp_leader_quest(p, leader_client_objective_xyz, leader_client=self.current_leader_client) for p in self.clients])
+                await asyncio.gather(*[navmap_tp_leader_quest(p, leader_client_objective_xyz, leader_client=leader_client) for p in self.clients])
 
     async def handle_normal_quests(self, follower_clients: list[Client], questing_friend_tp: bool):
+        leader_client = self.current_leader_client
         # Handles chest reroll menu, will always cancel
         await asyncio.gather(*[safe_click_window(c, cancel_chest_roll_path) for c in self.clients])
         # confirm exit dungeon early button
@@ -952,19 +1011,17 @@ class Quester():
 
         await asyncio.gather(*[self.leader_wait_for_free(p) for p in self.clients])
 
-        if await is_free_leader_questing(self.current_leader_client):
+        if await is_free_leader_questing(leader_client):
             for c in self.clients:
                 while await c.is_loading():
                     await asyncio.sleep(0.1)
 
-            current_pos = await self.current_leader_client.body.position()
-
-            leader_client_objective_xyz = await self.current_leader_client.quest_position.position()
-            if await is_visible_by_path(self.current_leader_client, npc_range_path) and calc_Distance(leader_client_objective_xyz, current_pos) < 750.0:
+            current_pos, leader_client_objective_xyz = await asyncio.gather(leader_client.body.position(), leader_client.quest_position.position())
+            if await is_visible_by_path(leader_client, npc_range_path) and calc_squareDistance(leader_client_objective_xyz, current_pos) < 750.0 ** 2:
                 # await self.handle_interactibles(current_leader_client)
 
                 # Handles interactables
-                sigil_msg_check = await self.read_popup(self.current_leader_client)
+                sigil_msg_check = await self.read_popup(leader_client)
                 if "to enter" in sigil_msg_check.lower():
                     while 'to enter' in sigil_msg_check.lower():
                         logger.debug('Entering dungeon')
@@ -974,7 +1031,7 @@ class Quester():
                             if await is_visible_by_path(c, dungeon_warning_path):
                                 await c.send_key(Keycode.ENTER, 0.1)
 
-                        sigil_msg_check = await self.read_popup(self.current_leader_client)
+                        sigil_msg_check = await self.read_popup(leader_client)
 
                     await self.handle_dungeon_entry(questing_friend_tp, follower_clients)
                 else:
@@ -982,16 +1039,16 @@ class Quester():
                     if 'to talk' in msg:
                         await asyncio.gather(*[p.send_key(Keycode.X, 0.1) for p in self.clients])
                         logger.debug('Talking to NPC')
-                        await self.handle_npc_talking_quests(self.current_leader_client, self.clients)
+                        await self.handle_npc_talking_quests(leader_client, self.clients)
                         
                     elif 'magic raft' in msg or 'to ride' in msg or 'to teleport' in msg:
-                        await self.current_leader_client.send_key(Keycode.X, 0.1)
+                        await leader_client.send_key(Keycode.X, 0.1)
                         await asyncio.sleep(1.0)
                         await asyncio.gather(*[p.send_key(Keycode.X, 0.1) for p in self.clients])
                     else:
                         await asyncio.gather(*[p.send_key(Keycode.X, 0.1) for p in self.clients])
 
-                    # original_zone = await self.current_leader_client.zone_name()
+                    # original_zone = await leader_client.zone_name()
 
                     await asyncio.sleep(2)
                     was_loading = False
@@ -1011,11 +1068,11 @@ class Quester():
 
                     await asyncio.sleep(0.75)
 
-                    if await is_visible_by_path(self.current_leader_client, spiral_door_teleport_path):
+                    if await is_visible_by_path(leader_client, spiral_door_teleport_path):
                         await self.handle_spiral_navigation()
             else:
                 # we may be on a photomancy quest
-                quest_objective = await get_quest_name(self.current_leader_client)
+                quest_objective = await self.read_quest_name(leader_client)
 
                 if "Photomance" in quest_objective:
                     # Photomancy quests (WC, KM, LM)
@@ -1050,8 +1107,7 @@ class Quester():
                 await asyncio.gather(*[p.teleport(XYZ(location.x + 500, location.y, location.z - 1500)) for p in self.clients])
                 await asyncio.sleep(2.0)
 
-    async def hardcoded_collect(self, incompatible_hardcoded_quests, truncated_quest_obj: str):
-        entity_data = incompatible_hardcoded_quests.get(truncated_quest_obj[:-1])
+    async def hardcoded_collect(self, entity_data: list, truncated_quest_obj: str):
         for c in self.clients:
             if c.process_id != self.current_leader_client.process_id:
                 current_quest = (await self.get_truncated_quest_objectives(c)).lower()
@@ -1103,7 +1159,6 @@ class Quester():
         if await is_free(self.current_leader_client) and not self.current_leader_client.entity_detect_combat_status:
             await self.current_leader_client.teleport(safe_location)
 
-        entity_data = incompatible_hardcoded_quests.get(truncated_quest_obj[:-1])
         current_quest = truncated_quest_obj
         while current_quest == truncated_quest_obj:
             await asyncio.sleep(1.0)
@@ -1135,10 +1190,10 @@ class Quester():
             await self.auto_collect_rewrite(self.current_leader_client)
 
     async def bring_clients_to_same_location(self, questing_friend_tp: bool, gear_switching_in_solo_zones: bool):
-        leader_pos = await self.current_leader_client.body.position()
+        leader_pos, leader_zone = await asyncio.gather(self.current_leader_client.body.position(), self.current_leader_client.zone_name())
         teleported = False
         for c in self.clients:
-            if await c.zone_name() == await self.current_leader_client.zone_name():
+            if await c.zone_name() == leader_zone:
                 errored = True
                 # teleport throws should update bool
                 while errored:
@@ -1225,7 +1280,7 @@ class Quester():
 
         # information needed for handle_repeated_normal_quest_failures()
         iterations_since_last_quest_change = 0
-        leader_last_full_quest = await get_quest_name(self.current_leader_client)
+        leader_last_full_quest = await self.read_quest_name(self.current_leader_client)
         last_leader_pid = self.current_leader_client.process_id
         last_leader_zone = await self.current_leader_client.zone_name()
 
@@ -1255,7 +1310,7 @@ class Quester():
 
             if await is_free_leader_questing(self.current_leader_client):
                 quest_xyz = await self.current_leader_client.quest_position.position()
-                distance = calc_Distance(quest_xyz, XYZ(0.0, 0.0, 0.0))
+                distance = calc_squareDistance(quest_xyz, XYZ(0.0, 0.0, 0.0))
 
                 # we are almost certainly not on a collect quest
                 if distance > 1:
@@ -1269,45 +1324,39 @@ class Quester():
                     # Double check - sometimes wiz lies about quest position - a simple sleep and re-grabbing of the quest xyz solves the issue
                     await asyncio.sleep(3.0)
                     quest_xyz = await self.current_leader_client.quest_position.position()
-                    distance = calc_Distance(quest_xyz, XYZ(0.0, 0.0, 0.0))
+                    distance = calc_squareDistance(quest_xyz, XYZ(0.0, 0.0, 0.0))
 
                     if distance < 1:
-                        quest_objective = await get_quest_name(self.current_leader_client)
+                        quest_objective = await self.read_quest_name(self.current_leader_client)
 
                         truncated_quest_obj = (await self.get_truncated_quest_objectives(self.current_leader_client)).lower()
-                        # Key - truncated quest name
-                        # Values - 0: time between entity respawns, 1-... : xyz locations of separate entities belonging to the quest
-                        # TODO: Get rid of this once scripting system allows for quest libraries
-                        incompatible_hardcoded_quests = {
-                            'find submarine parts in the floating land': [40, XYZ(x=-17412.53515625, y=10505.794921875, z=-429.19927978515625), XYZ(x=-17088.447265625, y=12284.244140625, z=-410.1100769042969), XYZ(x=-21681.78125, y=11547.5966796875, z=-429.19927978515625)]
-                            , 'collect sea cucumbers in pitch black lake': [40, XYZ(x=-8995.333984375, y=-830.6781616210938, z=-97.31965637207031), XYZ(x=-9911.9404296875, y=823.7628173828125, z=-97.31971740722656), XYZ(x=-11497.998046875, y=-1030.2618408203125, z=-97.32334899902344), XYZ(x=-12099.0517578125, y=-4674.13623046875, z=-96.95536804199219), XYZ(x=-14215.37109375, y=-4371.93798828125, z=-97.32661437988281), XYZ(x=-14287.5556640625, y=-2835.4814453125, z=-97.3197021484375)]
-                            , 'catch vonda fish in pitch black lake': [3, XYZ(x=-10030.9912109375, y=-7925.51953125, z=-347.3206787109375)]
-                            , 'break mining equipment in tyrian gorge': [25, XYZ(x=-2529.12890625, y=-3015.832763671875, z=-906.33837890625), XYZ(x=-3181.15234375, y=-6233.39306640625, z=-924.6146240234375), XYZ(x=1495.8695068359375, y=-7369.19580078125, z=-905.3265380859375), XYZ(x=-204.098876953125, y=-8468.421875, z=236.10702514648438), XYZ(x=2508.4169921875, y=-4712.10302734375, z=-1232.338134765625)]
-                            , 'steal barrel of kermes fire in tyrian gorge': [35, XYZ(x=1352.575927734375, y=-4787.16552734375, z=-1098.1168212890625), XYZ(x=-1936.0185546875, y=-3954.15380859375, z=-1077.83837890625), XYZ(x=-1820.606201171875, y=-6331.4541015625, z=-1077.849853515625), XYZ(x=517.3740844726562, y=-7042.94287109375, z=-1077.84130859375), XYZ(x=-4628.16650390625, y=-5603.2578125, z=-906.51318359375), XYZ(x=-3216.014892578125, y=-5965.7412109375, z=-932.0715942382812), XYZ(x=-1106.3753662109375, y=-3800.721923828125, z=-905.3256225585938), XYZ(x=-451.9595031738281, y=-4547.75537109375, z=-905.325927734375)]
-                        }
-
-                        if any(map(truncated_quest_obj.__contains__, incompatible_hardcoded_quests.keys())):
+
+                        # look the quest up once and hand its entity data straight to hardcoded_collect
+                        hardcoded_entity_data = next((entity_data for quest, entity_data in incompatible_hardcoded_quests.items() if quest in truncated_quest_obj), None)
+
+                        if hardcoded_entity_data is not None:
                             logger.debug('Hardcoded collect')
-                            await self.hardcoded_collect(incompatible_hardcoded_quests, truncated_quest_obj)
+                            await self.hardcoded_collect(hardcoded_entity_data, truncated_quest_obj)
                         # normal collect quest
                         else:
                             logger.debug('Completing collect quest')
                             await self.handle_collect_quests()
 
                     else:
-                        logger.debug('False collect quest detected.  Quest position: ' + str(distance))
+                        logger.debug('False collect quest detected.  Quest position: ' + str(quest_xyz))
 
             # keep track of how many loops we've gone through without changing our quest
             # if leader happened to change, reset the counter
-            leader_full_current_quest = await get_quest_name(self.current_leader_client)
+            leader_full_current_quest = await self.read_quest_name(self.current_leader_client)
+            leader_current_zone = await self.current_leader_client.zone_name()
             # quest hasn't changed, new leader has not been assigned, and zone hasn't changed
             # this means we have failed to complete the last single quest objective
-            if leader_full_current_quest == leader_last_full_quest and last_leader_pid == self.current_leader_client.process_id and last_leader_zone == await self.current_leader_client.zone_name():
+            if leader_full_current_quest == leader_last_full_quest and last_leader_pid == self.current_leader_client.process_id and last_leader_zone == leader_current_zone:
                 iterations_since_last_quest_change += 1
             else:
-                leader_last_full_quest = await get_quest_name(self.current_leader_client)
+                leader_last_full_quest = leader_full_current_quest
                 last_leader_pid = self.current_leader_client.process_id
-                last_leader_zone = await self.current_leader_client.zone_name()
+                last_leader_zone = leader_current_zone
                 iterations_since_last_quest_change = 0
 
     async def handle_questing_zone_change(self):
@@ -1337,7 +1386,7 @@ class Quester():
                     logger.debug('Client ' + self.client.title + ' leveled up - training pet.')
                     await auto_pet(self.client, ignore_pet_level_up, play_dance_game, questing=True)
 
-            distance = calc_Distance(quest_xyz, XYZ(0.0, 0.0, 0.0))
+            distance = calc_squareDistance(quest_xyz, XYZ(0.0, 0.0, 0.0))
             if distance > 1:
                 while self.client.entity_detect_combat_status:
                     await asyncio.sleep(.1)
@@ -1353,7 +1402,7 @@ class Quester():
                     await click_window_by_path(self.client, cancel_chest_roll_path)
 
                 current_pos = await self.client.body.position()
-                if await is_visible_by_path(self.client, npc_range_path) and calc_Distance(quest_xyz, current_pos) < 750.0:
+                if await is_visible_by_path(self.client, npc_range_path) and calc_squareDistance(quest_xyz, current_pos) < 750.0 ** 2:
                     # Handles interactables
                     sigil_msg_check = await self.read_popup(self.client)
                     if "to enter" in sigil_msg_check.lower():
@@ -1382,7 +1431,7 @@ class Quester():
                             if await self.new_world_doors(self.client) == False:
                                 await spiral_door_with_quest(self.client)
 
-                quest_objective = await get_quest_name(self.client)
+                quest_objective = await self.read_quest_name(self.client)
 
                 if "Photomance" in quest_objective:
                     # Photomancy quests (WC, KM, LM)
@@ -1399,7 +1448,7 @@ class Quester():
                 # Double check - sometimes wiz lies about quest position - a simple sleep and re-grabbing of the quest xyz seems to solve the issue
                 await asyncio.sleep(3.0)
                 quest_xyz = await self.client.quest_position.position()
-                distance = calc_Distance(quest_xyz, XYZ(0.0, 0.0, 0.0))
+                distance = calc_squareDistance(quest_xyz, XYZ(0.0, 0.0, 0.0))
 
                 if distance < 1:
                     await self.auto_collect_rewrite(self.client)
@@ -154,7 +154,10 @@ def calc_Distance(xyz_1 : XYZ, xyz_2 : XYZ):
 
 def calc_squareDistance(xyz_1 : XYZ, xyz_2 : XYZ):
     # calculates the distance between 2 XYZs, but doesn't square root the answer to be much more efficient. Useful for comparing distances, not much else.
-    return (pow(xyz_1.x - xyz_2.x, 2.0)) + (pow(xyz_1.y - xyz_2.y, 2.0)) + (pow(xyz_1.z - xyz_2.z, 2.0))
+    dx = xyz_1.x - xyz_2.x
+    dy = xyz_1.y - xyz_2.y
+    dz = xyz_1.z - xyz_2.z
+    return dx * dx + dy * dy + dz * dz
 
 
 async def calc_up_XYZ(client: Client, xyz : XYZ = None, speed_constant : int = 580, speed_adjusted : bool = True):
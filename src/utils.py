@@ -17,7 +17,7 @@ from src.dance_game_hook import attempt_deactivate_dance_hook
 from src.paths import *
 from src.sprinty_client import SprintyClient
 import typing
-from typing import List, Optional, Coroutine, Union, get_type_hints, Any, Iterable
+from typing import List, Optional, Coroutine, Union, get_type_hints, Any, Iterable, Callable, Awaitable
 from enum import Enum
 
 import os
@@ -730,12 +730,22 @@ async def is_free(client: Client):
     return not any([await client.is_loading(), await client.in_battle(), await is_visible_by_path(client, advance_dialog_path)])
 
 
-async def get_quest_name(client: Client):
+async def find_quest_name_window(client: Client) -> Window:
+    return await get_window_from_path(client.root_window, quest_name_path)
+
+
+async def get_quest_name(client: Client, quest_name_window_finder: Callable[[Client], Awaitable[Window]] = find_quest_name_window):
     while not await is_free(client):
         await asyncio.sleep(0.1)
-    quest_name_window = await get_window_from_path(client.root_window, quest_name_path)
-    while not await is_visible_by_path(client, quest_name_path):
-        await asyncio.sleep(0.1)
+    # callers that hold on to the quest name window pass their own finder, it is only asked once the client is free
+    quest_name_window = await quest_name_window_finder(client)
+    if not quest_name_window or not await quest_name_window.is_visible():
+        # back off from 10ms up to 200ms, the window is usually there right away but can take seconds after a zone change
+        delay = 0.01
+        while not await is_visible_by_path(client, quest_name_path):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+        quest_name_window = await quest_name_window_finder(client)
     quest_objective = await quest_name_window.maybe_text()
     quest_objective = quest_objective.replace('<center>', '')
     quest_objective = quest_objective.replace('</center>', '')
@@ -1188,16 +1198,6 @@ async def pid_to_client(clients: List[Client], pid: int) -> Client:
         return None
 
 
-async def wait_for_visible_by_path(client: Client, path: List[str], wait_for_not: bool = False, interval: float = 0.25):
-    if wait_for_not:
-        while await is_visible_by_path(client, path):
-            await asyncio.sleep(interval)
-
-    else:
-        while not await is_visible_by_path(client, path):
-            await asyncio.sleep(interval)
-
-
 async def try_task_coro(coro: Coroutine, clients: List[Client], deactive_mouseless: bool = False):
     task_coro = coro
     try:
@@ -1216,6 +1216,18 @@ async def try_task_coro(coro: Coroutine, clients: List[Client], deactive_mousele
         pass
 
 
+def log_task_exception(task: asyncio.Task):
+    # feature tasks are only ever cancelled, never awaited, so without this any other error would kill them silently
+    if not task.cancelled() and task.exception() is not None:
+        logger.opt(exception=task.exception()).error(f'Task {task.get_name()} stopped with an error')
+
+
+def create_try_task(coro: Coroutine, clients: List[Client], deactive_mouseless: bool = False) -> asyncio.Task:
+    task = asyncio.create_task(try_task_coro(coro, clients, deactive_mouseless))
+    task.add_done_callback(log_task_exception)
+    return task
+
+
 def index_with_str(input_str, desired_str: str) -> int:
     for i, s in enumerate(input_str):
         if desired_str in s.lower():